@@ -55,77 +55,17 @@
                     ${pkgs.hydra}/bin/hydra-create-user admin --full-name "Admin" --email admin@example.com --password admin --role admin 2>/dev/null || true
 
                     # Start health check server in background
-                    ${pkgs.python3}/bin/python3 -c '
-          import http.server
-          import socketserver
-          import json
-          import threading
-          from urllib.request import urlopen
-
-          class HealthHandler(http.server.BaseHTTPRequestHandler):
-              def do_GET(self):
-                  if self.path == "/health":
-                      try:
-                          response = urlopen("http://localhost:3000/", timeout=5)
-                          if response.status == 200:
-                              self.send_response(200)
-                              self.send_header("Content-type", "application/json")
-                              self.end_headers()
-                              self.wfile.write(json.dumps({"status": "healthy", "hydra": "running"}).encode())
-                          else:
-                              raise Exception("Hydra not responding")
-                      except Exception as e:
-                          self.send_response(503)
-                          self.send_header("Content-type", "application/json")
-                          self.end_headers()
-                          self.wfile.write(json.dumps({"status": "unhealthy", "error": str(e)}).encode())
-                  else:
-                      self.send_response(404)
-                      self.end_headers()
-
-          def run_health_server():
-              with socketserver.TCPServer(("", 8080), HealthHandler) as httpd:
-                  httpd.serve_forever()
-
-          threading.Thread(target=run_health_server, daemon=True).start()
-          ' &
+                    ${healthCheckScript} &
 
                     # Start Hydra server
                     exec ${pkgs.hydra}/bin/hydra-server --host 0.0.0.0 --port 3000
         '';
 
         # Health check script
-        healthCheckScript = pkgs.writeScript "health-check.py" ''
-          #!${pkgs.python3}/bin/python3
-          import http.server
-          import socketserver
-          import json
-          from urllib.request import urlopen
-
-          class HealthHandler(http.server.BaseHTTPRequestHandler):
-              def do_GET(self):
-                  if self.path == "/health":
-                      try:
-                          response = urlopen("http://localhost:3000/", timeout=5)
-                          if response.status == 200:
-                              self.send_response(200)
-                              self.send_header("Content-type", "application/json")
-                              self.end_headers()
-                              self.wfile.write(json.dumps({"status": "healthy", "hydra": "running"}).encode())
-                          else:
-                              raise Exception("Hydra not responding")
-                      except Exception as e:
-                          self.send_response(503)
-                          self.send_header("Content-type", "application/json")
-                          self.end_headers()
-                          self.wfile.write(json.dumps({"status": "unhealthy", "error": str(e)}).encode())
-                  else:
-                      self.send_response(404)
-                      self.end_headers()
-
-          with socketserver.TCPServer(("", 8080), HealthHandler) as httpd:
-              httpd.serve_forever()
-        '';
+        healthCheckScript = pkgs.writeScript "health-check.py" (
+          "#!${pkgs.python3}/bin/python3\n"
+          + pkgs.lib.removePrefix "#!/usr/bin/env python3\n" (builtins.readFile ./health-check.py)
+        );
       in {
         name = system;
         value = {
@@ -1,43 +1,106 @@
 #!/usr/bin/env python3
+import http.client
 import http.server
-import socketserver
 import json
-from urllib.request import urlopen
-from urllib.error import URLError
+import threading
+
+def _dumps(obj):
+    return json.dumps(obj).encode()
+
+_HEALTHY_BODY = _dumps({
+    "status": "healthy",
+    "hydra": "running",
+    "port": 3000
+})
+
+# Status lines and fixed headers, written directly instead of going through
+# send_response()/send_header()/end_headers(). One of the _HDR_TAIL blocks
+# completes each response.
+_HDR_200_JSON = b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+_HDR_503_JSON = b"HTTP/1.1 503 Service Unavailable\r\nContent-Type: application/json\r\n"
+_HDR_404 = b"HTTP/1.1 404 Not Found\r\n"
+_HDR_TAIL = b"Server: %s\r\nDate: %s\r\nContent-Length: %d\r\n\r\n"
+_HDR_TAIL_CLOSE = (b"Server: %s\r\nDate: %s\r\nConnection: close\r\n"
+                   b"Content-Length: %d\r\n\r\n")
+
+# Idle keep-alive connections to Hydra, reused across probes. The lock only
+# guards checkout and return, so concurrent probes still run in parallel.
+_POOL_MAXSIZE = 4
+_POOL_LOCK = threading.Lock()
+_pool = []
+
+# Errors meaning Hydra closed a pooled connection while it sat idle
+_STALE_ERRORS = (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError)
+
+def _fetch_root(conn):
+    try:
+        conn.request("GET", "/")
+        response = conn.getresponse()
+        response.read()
+    except Exception:
+        conn.close()
+        raise
+    return response
+
+def _probe_hydra():
+    with _POOL_LOCK:
+        conn = _pool.pop() if _pool else None
+    response = None
+    if conn is not None:
+        try:
+            response = _fetch_root(conn)
+        except _STALE_ERRORS:
+            # Retry once on a fresh connection; timeouts are not retried
+            conn = None
+    if conn is None:
+        conn = http.client.HTTPConnection("localhost", 3000, timeout=5)
+        response = _fetch_root(conn)
+    with _POOL_LOCK:
+        if not response.will_close and len(_pool) < _POOL_MAXSIZE:
+            _pool.append(conn)
+            conn = None
+    if conn is not None:
+        conn.close()
+    return response.status
 
 class HealthHandler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    # Drop keep-alive clients that go idle so they don't pin a server thread
+    timeout = 30
+
     def do_GET(self):
         if self.path == "/health":
             try:
-                response = urlopen("http://localhost:3000/", timeout=5)
-                if response.status == 200:
-                    self.send_response(200)
-                    self.send_header("Content-type", "application/json")
-                    self.end_headers()
-                    self.wfile.write(json.dumps({
-                        "status": "healthy", 
-                        "hydra": "running",
-                        "port": 3000
-                    }).encode())
-                else:
-                    raise Exception("Hydra not responding")
+                status = _probe_hydra()
             except Exception as e:
-                self.send_response(503)
-                self.send_header("Content-type", "application/json")
-                self.end_headers()
-                self.wfile.write(json.dumps({
-                    "status": "unhealthy", 
-                    "error": str(e)
-                }).encode())
+                error = str(e)
+            else:
+                if status == 200:
+                    self._send(_HDR_200_JSON, _HEALTHY_BODY)
+                    return
+                error = "Hydra not responding"
+            self._send(_HDR_503_JSON, _dumps({
+                "status": "unhealthy",
+                "error": error
+            }))
         else:
-            self.send_response(404)
-            self.end_headers()
+            self._send(_HDR_404)
+
+    def _send(self, header, body=b""):
+        # close_connection is set when the client sent "Connection: close"
+        # or spoke HTTP/1.0; tell it the socket is about to be closed
+        tail = _HDR_TAIL_CLOSE if self.close_connection else _HDR_TAIL
+        tail %= (self.version_string().encode(),
+                 self.date_time_string().encode(), len(body))
+        # wfile is unbuffered, so join header and body into one send
+        self.wfile.write(header + tail + body)
 
     def log_message(self, format, *args):
         # Suppress logging to keep output clean
         pass
 
 if __name__ == "__main__":
-    with socketserver.TCPServer(("", 8080), HealthHandler) as httpd:
+    with http.server.ThreadingHTTPServer(("", 8080), HealthHandler) as httpd:
         print("Health check server starting on port 8080...")
-        httpd.serve_forever()
\ No newline at end of file
+        httpd.serve_forever()
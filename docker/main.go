@@ -3,13 +3,18 @@ package main
 import (
 	"encoding/json"
 	"log"
+	"mime"
 	"net/http"
+	"strconv"
 	"strings"
 	"time"
 )
 
 const (
 	nixpkgsProject = "nixpkgs"
+
+	// maxBodyBytes caps how much of a request body the mock reads.
+	maxBodyBytes = 1 << 20
 )
 
 type Project struct {
@@ -73,13 +78,183 @@ type LoginRequest struct {
 	Password string `json:"password"`
 }
 
+// Fixture data served by the mock API.
+var (
+	nixpkgsProjectInfo = Project{
+		Name:        nixpkgsProject,
+		DisplayName: "Nixpkgs",
+		Description: "Nix packages collection",
+		Enabled:     true,
+		Hidden:      false,
+	}
+	hydraProjectInfo = Project{
+		Name:        "hydra",
+		DisplayName: "Hydra",
+		Description: "Hydra continuous integration system",
+		Enabled:     true,
+		Hidden:      false,
+	}
+	trunkJobset = Jobset{
+		Name:        "trunk",
+		Project:     nixpkgsProject,
+		Description: "Main development branch",
+		Enabled:     1, // 1 = enabled
+		Hidden:      false,
+	}
+	helloBuild = newBuild(1, "hello", "hello-2.12.1", "/nix/store/xyz-hello.drv")
+)
+
+// Response bodies for fixed endpoints are encoded once at startup so the
+// handlers only have to copy bytes to the connection.
+var (
+	healthBody      = []byte("OK")
+	projectsBody    = mustEncode([]Project{nixpkgsProjectInfo, hydraProjectInfo})
+	trunkJobsetBody = mustEncode(trunkJobset)
+	jobsetsBody     = mustEncode([]Jobset{trunkJobset})
+	noJobsetsBody   = mustEncode([]Jobset{})
+	apiJobsetsBody  = mustEncode([]map[string]interface{}{
+		{
+			"name":            "trunk",
+			"project":         nixpkgsProject,
+			"nrtotal":         0,
+			"checkinterval":   300,
+			"haserrormsg":     false,
+			"nrscheduled":     0,
+			"nrfailed":        0,
+			"errortime":       0,
+			"fetcherrormsg":   nil,
+			"starttime":       nil,
+			"lastcheckedtime": 1692000000,
+			"triggertime":     nil,
+		},
+	})
+	noAPIJobsetsBody = mustEncode([]map[string]interface{}{})
+	evaluationsBody  = mustEncode(Evaluations{
+		Evals: []map[string]interface{}{
+			{
+				"id":        1,
+				"project":   nixpkgsProject,
+				"jobset":    "trunk",
+				"timestamp": 1692000000,
+			},
+		},
+	})
+	pushBody = mustEncode(PushResponse{
+		JobsetsTriggered: []string{nixpkgsProject + ":trunk"},
+	})
+	adminUserBody = mustEncode(User{
+		Username: "admin",
+		FullName: "Admin",
+	})
+	constituentsBody = mustEncode([]Build{})
+
+	searchNoneBody = mustEncode(newSearchResult("none"))
+)
+
+// Lookup tables keyed by the path segment or query value a handler
+// dispatches on.
+var (
+	projectBodies = map[string][]byte{
+		nixpkgsProject: mustEncode(nixpkgsProjectInfo),
+		"hydra":        mustEncode(hydraProjectInfo),
+	}
+	buildBodies = map[string][]byte{
+		"1":      mustEncode(helloBuild),
+		"123456": mustEncode(newBuild(123456, "hello", "hello-2.12.1", "/nix/store/xyz-hello.drv")),
+		"123459": mustEncode(inProgressBuild()),
+		"123460": mustEncode(failedBuild()),
+	}
+	searchBodies = map[string][]byte{
+		"":      mustEncode(newSearchResult("")),
+		"hello": mustEncode(newSearchResult("hello")),
+		"nix":   mustEncode(newSearchResult("nix")),
+	}
+)
+
+// mustEncode marshals v the same way json.Encoder does, including the
+// trailing newline, and panics on failure since fixtures are static.
+func mustEncode(v interface{}) []byte {
+	b, err := json.Marshal(v)
+	if err != nil {
+		panic(err)
+	}
+
+	return append(b, '\n')
+}
+
+// writeJSON writes a precomputed JSON body with an explicit Content-Length.
+func writeJSON(w http.ResponseWriter, body []byte) {
+	h := w.Header()
+	h.Set("Content-Type", "application/json")
+	h.Set("Content-Length", strconv.Itoa(len(body)))
+	_, _ = w.Write(body)
+}
+
+func newBuild(id int, job, nixName, drvPath string) Build {
+	return Build{
+		ID:            id,
+		Project:       nixpkgsProject,
+		Jobset:        "trunk",
+		Job:           job,
+		Timestamp:     1692000000,
+		StartTime:     1692000000,
+		StopTime:      1692000000,
+		BuildStatus:   0,
+		NixName:       nixName,
+		Finished:      true,
+		JobsetEvals:   []int{1},
+		Priority:      100,
+		DrvPath:       drvPath,
+		System:        "x86_64-linux",
+		BuildProducts: map[string]interface{}{},
+		BuildOutputs:  map[string]interface{}{},
+		BuildMetrics:  map[string]interface{}{},
+	}
+}
+
+func inProgressBuild() Build {
+	build := newBuild(123459, "gcc", "gcc-11.3.0", "/nix/store/xyz-gcc.drv")
+	build.StopTime = 0     // Not finished yet
+	build.Finished = false // In progress
+
+	return build
+}
+
+func failedBuild() Build {
+	build := newBuild(123460, "broken-package", "broken-package-1.0", "/nix/store/xyz-broken.drv")
+	build.BuildStatus = 1 // Failed
+
+	return build
+}
+
+func newSearchResult(query string) SearchResult {
+	result := SearchResult{
+		Jobsets:   []Jobset{},
+		Projects:  []Project{},
+		Builds:    []Build{},
+		BuildsDrv: []Build{},
+	}
+
+	// Mock search results based on query
+	if query == "hello" || query == "" {
+		result.Builds = append(result.Builds, helloBuild)
+	}
+
+	if query == "nix" || query == "" {
+		result.Projects = append(result.Projects, nixpkgsProjectInfo)
+	}
+
+	return result
+}
+
 func main() {
 	// Health check server
 	go func() {
 		mux := http.NewServeMux()
 		mux.HandleFunc("/health", func(w http.ResponseWriter, r *http.Request) {
+			w.Header().Set("Content-Length", strconv.Itoa(len(healthBody)))
 			w.WriteHeader(http.StatusOK)
-			_, _ = w.Write([]byte("OK"))
+			_, _ = w.Write(healthBody)
 		})
 
 		server := &http.Server{
@@ -135,198 +310,54 @@ func main() {
 }
 
 func handleProjects(w http.ResponseWriter, r *http.Request) {
-	projects := []Project{
-		{
-			Name:        nixpkgsProject,
-			DisplayName: "Nixpkgs",
-			Description: "Nix packages collection",
-			Enabled:     true,
-			Hidden:      false,
-		},
-		{
-			Name:        "hydra",
-			DisplayName: "Hydra",
-			Description: "Hydra continuous integration system",
-			Enabled:     true,
-			Hidden:      false,
-		},
+	// "/" is also the mux's catch-all; only the root itself lists projects
+	if r.URL.Path != "/" {
+		http.NotFound(w, r)
+
+		return
 	}
 
-	w.Header().Set("Content-Type", "application/json")
-	_ = json.NewEncoder(w).Encode(projects)
+	writeJSON(w, projectsBody)
 }
 
 func handleProject(w http.ResponseWriter, r *http.Request) {
 	projectName := strings.TrimPrefix(r.URL.Path, "/project/")
 
-	switch projectName {
-	case nixpkgsProject:
-		project := Project{
-			Name:        nixpkgsProject,
-			DisplayName: "Nixpkgs",
-			Description: "Nix packages collection",
-			Enabled:     true,
-			Hidden:      false,
-		}
-		w.Header().Set("Content-Type", "application/json")
-		_ = json.NewEncoder(w).Encode(project)
-	case "hydra":
-		project := Project{
-			Name:        "hydra",
-			DisplayName: "Hydra",
-			Description: "Hydra continuous integration system",
-			Enabled:     true,
-			Hidden:      false,
-		}
-		w.Header().Set("Content-Type", "application/json")
-		_ = json.NewEncoder(w).Encode(project)
-	default:
+	body, ok := projectBodies[projectName]
+	if !ok {
 		http.NotFound(w, r)
-	}
-}
 
-func handleSearch(w http.ResponseWriter, r *http.Request) {
-	query := r.URL.Query().Get("query")
-
-	result := SearchResult{
-		Jobsets:   []Jobset{},
-		Projects:  []Project{},
-		Builds:    []Build{},
-		BuildsDrv: []Build{},
+		return
 	}
 
-	// Mock search results based on query
-	if query == "hello" || query == "" {
-		result.Builds = append(result.Builds, Build{
-			ID:            1,
-			Project:       nixpkgsProject,
-			Jobset:        "trunk",
-			Job:           "hello",
-			Timestamp:     1692000000,
-			StartTime:     1692000000,
-			StopTime:      1692000000,
-			BuildStatus:   0,
-			NixName:       "hello-2.12.1",
-			Finished:      true,
-			JobsetEvals:   []int{1},
-			Priority:      100,
-			DrvPath:       "/nix/store/xyz-hello.drv",
-			System:        "x86_64-linux",
-			BuildProducts: map[string]interface{}{},
-			BuildOutputs:  map[string]interface{}{},
-			BuildMetrics:  map[string]interface{}{},
-		})
-	}
+	writeJSON(w, body)
+}
 
-	if query == "nix" || query == "" {
-		result.Projects = append(result.Projects, Project{
-			Name:        nixpkgsProject,
-			DisplayName: "Nixpkgs",
-			Description: "Nix packages collection",
-			Enabled:     true,
-			Hidden:      false,
-		})
+func handleSearch(w http.ResponseWriter, r *http.Request) {
+	body, ok := searchBodies[r.URL.Query().Get("query")]
+	if !ok {
+		body = searchNoneBody
 	}
 
-	w.Header().Set("Content-Type", "application/json")
-	_ = json.NewEncoder(w).Encode(result)
+	writeJSON(w, body)
 }
 
 func handleBuild(w http.ResponseWriter, r *http.Request) {
-	buildID := strings.TrimPrefix(r.URL.Path, "/build/")
-
-	// Support multiple build IDs
-	switch buildID {
-	case "1":
-		build := Build{
-			ID:            1,
-			Project:       nixpkgsProject,
-			Jobset:        "trunk",
-			Job:           "hello",
-			Timestamp:     1692000000,
-			StartTime:     1692000000,
-			StopTime:      1692000000,
-			BuildStatus:   0,
-			NixName:       "hello-2.12.1",
-			Finished:      true,
-			JobsetEvals:   []int{1},
-			Priority:      100,
-			DrvPath:       "/nix/store/xyz-hello.drv",
-			System:        "x86_64-linux",
-			BuildProducts: map[string]interface{}{},
-			BuildOutputs:  map[string]interface{}{},
-			BuildMetrics:  map[string]interface{}{},
-		}
-		w.Header().Set("Content-Type", "application/json")
-		_ = json.NewEncoder(w).Encode(build)
-	case "123456":
-		build := Build{
-			ID:            123456,
-			Project:       nixpkgsProject,
-			Jobset:        "trunk",
-			Job:           "hello",
-			Timestamp:     1692000000,
-			StartTime:     1692000000,
-			StopTime:      1692000000,
-			BuildStatus:   0,
-			NixName:       "hello-2.12.1",
-			Finished:      true,
-			JobsetEvals:   []int{1},
-			Priority:      100,
-			DrvPath:       "/nix/store/xyz-hello.drv",
-			System:        "x86_64-linux",
-			BuildProducts: map[string]interface{}{},
-			BuildOutputs:  map[string]interface{}{},
-			BuildMetrics:  map[string]interface{}{},
-		}
-		w.Header().Set("Content-Type", "application/json")
-		_ = json.NewEncoder(w).Encode(build)
-	case "123459":
-		// In-progress build
-		build := Build{
-			ID:            123459,
-			Project:       nixpkgsProject,
-			Jobset:        "trunk",
-			Job:           "gcc",
-			Timestamp:     1692000000,
-			StartTime:     1692000000,
-			StopTime:      0, // Not finished yet
-			BuildStatus:   0,
-			NixName:       "gcc-11.3.0",
-			Finished:      false, // In progress
-			JobsetEvals:   []int{1},
-			Priority:      100,
-			DrvPath:       "/nix/store/xyz-gcc.drv",
-			System:        "x86_64-linux",
-			BuildProducts: map[string]interface{}{},
-			BuildOutputs:  map[string]interface{}{},
-			BuildMetrics:  map[string]interface{}{},
-		}
-		w.Header().Set("Content-Type", "application/json")
-		_ = json.NewEncoder(w).Encode(build)
-	case "123460":
-		// Failed build
-		build := Build{
-			ID:            123460,
-			Project:       nixpkgsProject,
-			Jobset:        "trunk",
-			Job:           "broken-package",
-			Timestamp:     1692000000,
-			StartTime:     1692000000,
-			StopTime:      1692000000,
-			BuildStatus:   1, // Failed
-			NixName:       "broken-package-1.0",
-			Finished:      true,
-			JobsetEvals:   []int{1},
-			Priority:      100,
-			DrvPath:       "/nix/store/xyz-broken.drv",
-			System:        "x86_64-linux",
-			BuildProducts: map[string]interface{}{},
-			BuildOutputs:  map[string]interface{}{},
-			BuildMetrics:  map[string]interface{}{},
-		}
-		w.Header().Set("Content-Type", "application/json")
-		_ = json.NewEncoder(w).Encode(build)
+	// Paths are /build/ID or /build/ID/constituents
+	buildID, rest, _ := strings.Cut(strings.TrimPrefix(r.URL.Path, "/build/"), "/")
+
+	body, ok := buildBodies[buildID]
+	if !ok {
+		http.NotFound(w, r)
+
+		return
+	}
+
+	switch rest {
+	case "":
+		writeJSON(w, body)
+	case "constituents":
+		writeJSON(w, constituentsBody)
 	default:
 		http.NotFound(w, r)
 	}
@@ -339,8 +370,20 @@ func handleLogin(w http.ResponseWriter, r *http.Request) {
 		return
 	}
 
+	r.Body = http.MaxBytesReader(w, r.Body, maxBodyBytes)
 	var loginReq LoginRequest
-	if err := json.NewDecoder(r.Body).Decode(&loginReq); err != nil {
+	// ParseMediaType lower-cases the type; an unparsable header falls back to JSON
+	mediaType, _, _ := mime.ParseMediaType(r.Header.Get("Content-Type"))
+	if mediaType == "application/x-www-form-urlencoded" {
+		// Form logins as sent by the Hydra web UI; ParseForm handles percent-decoding
+		if err := r.ParseForm(); err != nil {
+			http.Error(w, "Invalid form", http.StatusBadRequest)
+
+			return
+		}
+		loginReq.Username = r.PostForm.Get("username")
+		loginReq.Password = r.PostForm.Get("password")
+	} else if err := json.NewDecoder(r.Body).Decode(&loginReq); err != nil {
 		http.Error(w, "Invalid JSON", http.StatusBadRequest)
 
 		return
@@ -357,12 +400,7 @@ func handleLogin(w http.ResponseWriter, r *http.Request) {
 			MaxAge:   3600,  // 1 hour
 		})
 
-		user := User{
-			Username: "admin",
-			FullName: "Admin",
-		}
-		w.Header().Set("Content-Type", "application/json")
-		_ = json.NewEncoder(w).Encode(user)
+		writeJSON(w, adminUserBody)
 	} else {
 		http.Error(w, "unauthorized", http.StatusUnauthorized)
 	}
@@ -370,49 +408,24 @@ func handleLogin(w http.ResponseWriter, r *http.Request) {
 
 func handleJobsets(w http.ResponseWriter, r *http.Request) {
 	// Extract project name from /jobsets/PROJECT
-	path := strings.TrimPrefix(r.URL.Path, "/jobsets/")
-	project := strings.Split(path, "/")[0]
+	project, _, _ := strings.Cut(strings.TrimPrefix(r.URL.Path, "/jobsets/"), "/")
 
 	if project == nixpkgsProject {
-		jobsets := []Jobset{
-			{
-				Name:        "trunk",
-				Project:     nixpkgsProject,
-				Description: "Main development branch",
-				Enabled:     1, // 1 = enabled
-				Hidden:      false,
-			},
-		}
-		w.Header().Set("Content-Type", "application/json")
-		_ = json.NewEncoder(w).Encode(jobsets)
+		writeJSON(w, jobsetsBody)
 	} else {
-		w.Header().Set("Content-Type", "application/json")
-		_ = json.NewEncoder(w).Encode([]Jobset{})
+		writeJSON(w, noJobsetsBody)
 	}
 }
 
 func handleJobset(w http.ResponseWriter, r *http.Request) {
 	// Extract project and jobset from /jobset/PROJECT/JOBSET
-	path := strings.TrimPrefix(r.URL.Path, "/jobset/")
-	parts := strings.Split(path, "/")
-
-	if len(parts) >= 2 {
-		project := parts[0]
-		jobsetName := parts[1]
-
-		if project == nixpkgsProject && jobsetName == "trunk" {
-			jobset := Jobset{
-				Name:        "trunk",
-				Project:     nixpkgsProject,
-				Description: "Main development branch",
-				Enabled:     1, // 1 = enabled
-				Hidden:      false,
-			}
-			w.Header().Set("Content-Type", "application/json")
-			_ = json.NewEncoder(w).Encode(jobset)
+	project, rest, ok := strings.Cut(strings.TrimPrefix(r.URL.Path, "/jobset/"), "/")
+	jobsetName, _, _ := strings.Cut(rest, "/")
 
-			return
-		}
+	if ok && project == nixpkgsProject && jobsetName == "trunk" {
+		writeJSON(w, trunkJobsetBody)
+
+		return
 	}
 
 	http.NotFound(w, r)
@@ -420,47 +433,18 @@ func handleJobset(w http.ResponseWriter, r *http.Request) {
 
 func handleEvaluations(w http.ResponseWriter, r *http.Request) {
 	// Mock evaluations response
-	evaluations := Evaluations{
-		Evals: []map[string]interface{}{
-			{
-				"id":        1,
-				"project":   nixpkgsProject,
-				"jobset":    "trunk",
-				"timestamp": 1692000000,
-			},
-		},
-	}
-	w.Header().Set("Content-Type", "application/json")
-	_ = json.NewEncoder(w).Encode(evaluations)
+	writeJSON(w, evaluationsBody)
 }
 
 func handleAPIJobsets(w http.ResponseWriter, r *http.Request) {
 	// Extract project from query parameter: /api/jobsets?project=nixpkgs
 	project := r.URL.Query().Get("project")
-	
+
 	if project == nixpkgsProject {
 		// Return JobsetOverview format (array of JobsetOverviewItem)
-		jobsets := []map[string]interface{}{
-			{
-				"name":             "trunk",
-				"project":          nixpkgsProject,
-				"nrtotal":          0,
-				"checkinterval":    300,
-				"haserrormsg":      false,
-				"nrscheduled":      0,
-				"nrfailed":         0,
-				"errortime":        0,
-				"fetcherrormsg":    nil,
-				"starttime":        nil,
-				"lastcheckedtime":  1692000000,
-				"triggertime":      nil,
-			},
-		}
-		w.Header().Set("Content-Type", "application/json")
-		_ = json.NewEncoder(w).Encode(jobsets)
+		writeJSON(w, apiJobsetsBody)
 	} else {
-		w.Header().Set("Content-Type", "application/json")
-		_ = json.NewEncoder(w).Encode([]map[string]interface{}{})
+		writeJSON(w, noAPIJobsetsBody)
 	}
 }
 
@@ -472,9 +456,5 @@ func handlePush(w http.ResponseWriter, r *http.Request) {
 	}
 
 	// Mock push response
-	response := PushResponse{
-		JobsetsTriggered: []string{nixpkgsProject + ":trunk"},
-	}
-	w.Header().Set("Content-Type", "application/json")
-	_ = json.NewEncoder(w).Encode(response)
+	writeJSON(w, pushBody)
 }
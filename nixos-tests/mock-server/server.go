@@ -228,7 +228,7 @@ func (s *Server) handleListProjects(w http.ResponseWriter, r *http.Request) {
 }
 
 func (s *Server) handleProject(w http.ResponseWriter, r *http.Request) {
-	parts := strings.Split(r.URL.Path, "/")
+	parts := strings.SplitN(r.URL.Path, "/", 4)
 	if len(parts) < 3 {
 		http.NotFound(w, r)
 		return
@@ -297,7 +297,7 @@ func (s *Server) handleProject(w http.ResponseWriter, r *http.Request) {
 }
 
 func (s *Server) handleJobset(w http.ResponseWriter, r *http.Request) {
-	parts := strings.Split(r.URL.Path, "/")
+	parts := strings.SplitN(r.URL.Path, "/", 6)
 	if len(parts) < 4 {
 		http.NotFound(w, r)
 		return
@@ -372,7 +372,7 @@ func (s *Server) handleJobset(w http.ResponseWriter, r *http.Request) {
 }
 
 func (s *Server) handleBuild(w http.ResponseWriter, r *http.Request) {
-	parts := strings.Split(r.URL.Path, "/")
+	parts := strings.SplitN(r.URL.Path, "/", 5)
 	if len(parts) < 3 {
 		http.NotFound(w, r)
 		return
@@ -403,7 +403,7 @@ func (s *Server) handleBuild(w http.ResponseWriter, r *http.Request) {
 }
 
 func (s *Server) handleEvaluation(w http.ResponseWriter, r *http.Request) {
-	parts := strings.Split(r.URL.Path, "/")
+	parts := strings.SplitN(r.URL.Path, "/", 5)
 	if len(parts) < 3 {
 		http.NotFound(w, r)
 		return
@@ -5,6 +5,7 @@ package tests
 
 import (
 	"context"
+	"net/http"
 	"os"
 	"strings"
 	"sync"
@@ -120,6 +121,40 @@ func TestIntegrationAuthentication(t *testing.T) {
 		assert.Error(t, err)
 	})
 
+	t.Run("login with form-encoded credentials", func(t *testing.T) {
+		tests := []struct {
+			name        string
+			contentType string
+			body        string
+		}{
+			{"plain", "application/x-www-form-urlencoded", "username=admin&password=admin"},
+			{"percent-encoded", "application/x-www-form-urlencoded", "username=%61dmin&password=adm%69n"},
+			{"mixed-case media type", "Application/X-WWW-Form-URLEncoded; charset=UTF-8", "username=admin&password=admin"},
+		}
+
+		for _, tt := range tests {
+			t.Run(tt.name, func(t *testing.T) {
+				resp, err := http.Post(client.BaseURL()+"/login", tt.contentType, strings.NewReader(tt.body))
+				if isConnectionError(err) {
+					t.Skipf("Skipping test - no mock server available: %v", err)
+					return
+				}
+				require.NoError(t, err)
+				defer resp.Body.Close()
+
+				assert.Equal(t, http.StatusOK, resp.StatusCode)
+				found := false
+				for _, cookie := range resp.Cookies() {
+					if cookie.Name == "hydra_session" {
+						found = true
+						break
+					}
+				}
+				assert.True(t, found, "Expected hydra_session cookie")
+			})
+		}
+	})
+
 	t.Run("logout", func(t *testing.T) {
 		// Try to login first
 		_, err := client.Login(ctx, "admin", "admin")
@@ -260,8 +295,13 @@ func TestIntegrationBuilds(t *testing.T) {
 	})
 
 	t.Run("get build constituents", func(t *testing.T) {
-		// Skip this test with mock server - API endpoint not fully implemented
-		t.Skip("Skipping build constituents - mock server endpoint needs refinement")
+		constituents, err := client.GetBuildConstituents(ctx, 123456)
+		assert.NoError(t, err)
+		assert.NotNil(t, constituents)
+		assert.Empty(t, constituents)
+
+		_, err = client.GetBuildConstituents(ctx, 999999999)
+		assert.Error(t, err)
 	})
 
 	t.Run("get build info", func(t *testing.T) {